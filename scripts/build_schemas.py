@@ -18,62 +18,24 @@
 Generates binary schema files (.bfbs) bundled in the SDK release.
 """
 
-import argparse
-import glob
+import common
+import functools
 import os
-import platform
-import subprocess
+import re
 import sys
-
-def find_in_paths(name, paths):
-    """Searches for a file with named `name` in the given paths and returns it."""
-    for path in paths:
-        full_path = os.path.join(path, name)
-        if os.path.isfile(full_path):
-            return full_path
-    # If not found, just assume it's in the PATH.
-    return name
-
-
-# The project root directory, which is one level up from this script's
-# directory.
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__),
-                                            os.path.pardir))
-
-# Directories that may contain the FlatBuffers compiler.
-FLATBUFFERS_PATHS = [
-    os.path.join(PROJECT_ROOT, 'bin'),
-    os.path.join(PROJECT_ROOT, 'bin', 'Release'),
-    os.path.join(PROJECT_ROOT, 'bin', 'Debug')
-]
-
-# Windows uses the .exe extension on executables.
-EXECUTABLE_EXTENSION = '.exe' if platform.system() == 'Windows' else ''
-
-# Name of the flatbuffer executable.
-FLATC_EXECUTABLE_NAME = 'flatc' + EXECUTABLE_EXTENSION
+from concurrent.futures import ThreadPoolExecutor
 
 # Location of FlatBuffers compiler.
-FLATC = find_in_paths(FLATC_EXECUTABLE_NAME, FLATBUFFERS_PATHS)
+FLATC = common.find_in_paths(common.FLATC_EXECUTABLE_NAME, common.FLATBUFFERS_PATHS)
 
-class BuildError(Exception):
-    """Error indicating there was a problem building assets."""
+# Directory containing the flatbuffer schemas.
+SCHEMAS_PATH = os.path.join(common.PROJECT_ROOT, 'schemas')
 
-    def __init__(self, argv, error_code, message=None):
-        Exception.__init__(self)
-        self.argv = argv
-        self.error_code = error_code
-        self.message = message if message else ''
+# The flatc include arguments for the schemas directory.
+SCHEMA_INCLUDE_ARGS = ['-I', SCHEMAS_PATH]
 
-
-def run_subprocess(argv):
-    try:
-        process = subprocess.Popen(argv)
-    except OSError as e:
-        raise BuildError(argv, 1, message=str(e))
-    process.wait()
-    if process.returncode:
-        raise BuildError(argv, process.returncode)
+# Matches the include statements of a flatbuffer schema.
+INCLUDE_PATTERN = re.compile(r'^\s*include\s+"([^"]+)";', re.MULTILINE)
 
 
 def compile_flatbuffer_binary_schema(flatc, schema, out_dir):
@@ -87,28 +49,86 @@ def compile_flatbuffer_binary_schema(flatc, schema, out_dir):
     Raises:
       BuildError: Process return code was nonzero.
     """
-    command = [flatc, '-o', out_dir]
-    command.extend(['-I', os.path.join(PROJECT_ROOT, 'schemas')])
-    command.extend(['-b', schema, '--schema'])
-    run_subprocess(command)
+    common.run_subprocess([flatc, '-o', out_dir, *SCHEMA_INCLUDE_ARGS, '-b', schema, '--schema'])
+
+
+@functools.lru_cache(maxsize=None)
+def schema_includes(schema):
+    """Returns the paths of the schemas directly included by the given schema.
+
+    Included schemas are searched next to the given schema, then in the
+    schemas directory, like flatc does.
+    """
+    try:
+        with open(schema, 'r') as f:
+            includes = INCLUDE_PATTERN.findall(f.read())
+    except OSError:
+        return []
+    paths = [os.path.dirname(schema), SCHEMAS_PATH]
+    return [os.path.normpath(common.find_in_paths(include, paths)) for include in includes]
+
+
+def schema_dependencies(schema):
+    """Returns the given schema and all the schemas it includes, directly or not."""
+    dependencies = set()
+    pending = [os.path.normpath(schema)]
+    while pending:
+        path = pending.pop()
+        if path not in dependencies:
+            dependencies.add(path)
+            pending.extend(schema_includes(path))
+    return dependencies
+
+
+def schema_mtime_ns(schema):
+    """Returns the most recent modification time of the schema and its includes, in nanoseconds."""
+    mtime = 0
+    for path in schema_dependencies(schema):
+        try:
+            mtime = max(mtime, os.stat(path).st_mtime_ns)
+        except OSError:
+            # Let flatc report the missing include.
+            pass
+    return mtime
 
 
 def generate_flatbuffer_binaries(flatc, target_directory):
     """Run the flatbuffer compiler on the all the flatbuffer schema files.
 
+    Only the schemas which changed, or which include a schema that changed,
+    since their binary schema was generated are compiled.
+
     Args:
       flatc: Path to the flatc binary.
       target_directory: Path to the target assets directory.
     """
-    for schema in glob.glob(os.path.join(PROJECT_ROOT, 'schemas', '*.fbs'), recursive=False):
-        compile_flatbuffer_binary_schema(flatc, schema, target_directory)
+    with os.scandir(SCHEMAS_PATH) as entries:
+        schemas = [entry.path for entry in entries if entry.name.endswith('.fbs')]
+    schemas = [schema for schema in schemas if common.needs_rebuild(
+        schema_mtime_ns(schema),
+        os.path.join(target_directory, os.path.basename(schema)[:-len('.fbs')] + '.bfbs'))]
+    os.makedirs(target_directory, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(compile_flatbuffer_binary_schema, flatc, schema, target_directory)
+                   for schema in schemas]
+        errors = []
+        for future in futures:
+            try:
+                future.result()
+            except common.BuildError as error:
+                errors.append(error)
+
+    if errors:
+        raise common.merge_build_errors(errors)
 
 
 def main(argv):
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument('--flatc', default=FLATC,
                         help='Location of the flatbuffers compiler.')
-    parser.add_argument('--output', default=os.path.join(PROJECT_ROOT, 'schemas'),
+    parser.add_argument('--output', default=SCHEMAS_PATH,
                         help='Assets output directory.')
     parser.add_argument('args', nargs=argparse.REMAINDER)
     args = parser.parse_args()
@@ -116,8 +136,8 @@ def main(argv):
 
     try:
         generate_flatbuffer_binaries(args.flatc, args.output)
-    except BuildError as error:
-        handle_build_error(error)
+    except common.BuildError as error:
+        common.handle_build_error(error)
         return 1
 
     return 0
@@ -33,11 +33,13 @@ def main(argv):
     options = common.CommandOptions(argv, "clean_project", "0.2.0")
 
     try:
-        common.clean_flatbuffers_binaries(
-            common.get_conversion_data(options.project_path),
-            options.project_path,
-            options.build_path
-        )
+        # The build cache knows every generated binary, only scan the project when there is none.
+        if not common.clean_cached_flatbuffers_binaries(options.build_path):
+            common.clean_flatbuffers_binaries(
+                common.get_conversion_data(options.project_path),
+                options.project_path,
+                options.build_path
+            )
         print("Amplitude binary assets cleaned successfully.")
     except common.BuildError as error:
         common.handle_build_error(error)
@@ -15,25 +15,99 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import getopt
-import glob
+import functools
+import hashlib
+import json as json_module
+import logging
 import os
+import platform
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 
-# The path to the Amplitude Audio SDK
-SDK_PATH = os.getenv("AM_SDK_PATH") or os.getcwd()
-
-# The Amplitude Audio SDK schemas directory.
-SCHEMA_PATHS = [
-    os.path.join(SDK_PATH, "schemas")
+# Logger reporting the build errors, printed to stderr.
+logger = logging.getLogger("amplitude.build")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+# Format of the message reporting a BuildError.
+BUILD_ERROR_FORMAT = "Error running command `%s`. Returned %s.\n%s"
+
+# The project root directory, which is one level up from this script's
+# directory.
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                            os.path.pardir))
+
+# Directories of the project that may contain the FlatBuffers compiler.
+FLATBUFFERS_PATHS = [
+    os.path.join(PROJECT_ROOT, 'bin'),
+    os.path.join(PROJECT_ROOT, 'bin', 'Release'),
+    os.path.join(PROJECT_ROOT, 'bin', 'Debug')
 ]
 
+# Windows uses the .exe extension on executables.
+EXECUTABLE_EXTENSION = '.exe' if platform.system() == 'Windows' else ''
+
 # Name of the flatbuffers executable.
-FLATC = (shutil.which("flatc")
-         or os.path.join(SDK_PATH, "bin", os.getenv("AM_SDK_PLATFORM") or "", "flatc"))
+FLATC_EXECUTABLE_NAME = 'flatc' + EXECUTABLE_EXTENSION
+
+
+@functools.lru_cache(maxsize=None)
+def get_sdk_path():
+    """Returns the path to the Amplitude Audio SDK."""
+    return os.getenv("AM_SDK_PATH") or os.getcwd()
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_paths():
+    """Returns the Amplitude Audio SDK schemas directories."""
+    return [
+        os.path.join(get_sdk_path(), "schemas")
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_include_args():
+    """Returns the flatc include arguments for the schemas directories."""
+    return [arg for path in get_schema_paths() for arg in ("-I", path)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_flatc():
+    """Returns the location of the flatbuffers compiler, searching the PATH on the first call only."""
+    return (shutil.which(FLATC_EXECUTABLE_NAME)
+            or os.path.join(get_sdk_path(), "bin", os.getenv("AM_SDK_PLATFORM") or "", FLATC_EXECUTABLE_NAME))
+
+
+# Module attributes resolved on first access, so scripts which only print their help or version never touch the
+# filesystem.
+LAZY_ATTRIBUTES = {
+    "SDK_PATH": get_sdk_path,
+    "SCHEMA_PATHS": get_schema_paths,
+    "SCHEMA_INCLUDE_ARGS": get_schema_include_args,
+    "FLATC": get_flatc,
+}
+
+
+def __getattr__(name):
+    """Resolves the LAZY_ATTRIBUTES of this module (PEP 562)."""
+    if name in LAZY_ATTRIBUTES:
+        return LAZY_ATTRIBUTES[name]()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+# Maximum length of a command line. Half of ARG_MAX leaves room for the environment variables.
+MAX_COMMAND_LENGTH = 30000 if os.name == "nt" else os.sysconf("SC_ARG_MAX") // 2
+
+# Name of the file storing the state of the last build, in the output directory.
+BUILD_CACHE_FILENAME = ".amplitude_build_cache.json"
 
 # Directory where unprocessed sound flatbuffers data can be found.
 SOUNDS_DIR_NAME = 'sounds'
@@ -68,6 +142,44 @@ EFFECTS_DIR_NAME = 'effects'
 # Directory where unprocessed environment flatbuffers data can be found.
 ENVIRONMENTS_DIR_NAME = 'environments'
 
+# Extensions of the binaries generated from json files, by file name suffix.
+FILE_SUFFIX_EXTENSIONS = {
+    "config.json": ".amconfig",
+    "buses.json": ".ambus",
+}
+
+# Extensions of the binaries generated from json files, by asset directory.
+DIRECTORY_EXTENSIONS = {
+    SOUNDBANKS_DIR_NAME: ".ambank",
+    COLLECTIONS_DIR_NAME: ".amcollection",
+    EVENTS_DIR_NAME: ".amevent",
+    PIPELINES_DIR_NAME: ".ampipeline",
+    ATTENUATORS_DIR_NAME: ".amattenuation",
+    SWITCHES_DIR_NAME: ".amswitch",
+    SWITCH_CONTAINERS_DIR_NAME: ".amswitchcontainer",
+    RTPC_DIR_NAME: ".amrtpc",
+    SOUNDS_DIR_NAME: ".amsound",
+    ENVIRONMENTS_DIR_NAME: ".amenv",
+    EFFECTS_DIR_NAME: ".amfx",
+}
+
+# The schemas used to convert the json files of a project. Each schema applies either to the files at the root of the
+# project ending with the given suffix, or to all the json files found in the given directory.
+CONVERSION_SCHEMAS = [
+    ('engine_config_definition.bfbs', '.config.json'),
+    ('buses_definition.bfbs', '.buses.json'),
+    ('sound_bank_definition.bfbs', SOUNDBANKS_DIR_NAME),
+    ('collection_definition.bfbs', COLLECTIONS_DIR_NAME),
+    ('sound_definition.bfbs', SOUNDS_DIR_NAME),
+    ('event_definition.bfbs', EVENTS_DIR_NAME),
+    ('pipeline_definition.bfbs', PIPELINES_DIR_NAME),
+    ('attenuation_definition.bfbs', ATTENUATORS_DIR_NAME),
+    ('switch_definition.bfbs', SWITCHES_DIR_NAME),
+    ('switch_container_definition.bfbs', SWITCH_CONTAINERS_DIR_NAME),
+    ('rtpc_definition.bfbs', RTPC_DIR_NAME),
+    ('effect_definition.bfbs', EFFECTS_DIR_NAME),
+]
+
 
 class FlatbuffersConversionData(object):
     """Holds data needed to convert a set of json files to flatbuffers binaries.
@@ -98,43 +210,44 @@ class CommandOptions(object):
 
     project_path: str = None
     build_path: str = None
-    flatc_path: str = FLATC
+    flatc_path: str = None
 
     def __init__(self, argv, script_name: str, script_version: str):
-        opts, args = getopt.getopt(argv, "hvp:b:f:",
-                                   ["help", "version", "project-path", "build-path", "flatc", "no-logo"])
-
-        no_logo = False
-        show_help = False
-        show_version = False
-
-        for opt, arg in opts:
-            if opt == "--no-logo":
-                no_logo = True
-            elif opt in ("-h", "--help"):
-                show_help = True
-            elif opt in ("-v", "--version"):
-                show_version = True
-            elif opt in ("-p", "--project-path"):
-                self.project_path = arg
-            elif opt in ("-b", "--build-path"):
-                self.build_path = arg
-            elif opt in ("-f", "--flatc"):
-                self.flatc_path = arg
-
-        if show_help:
-            print_help(no_logo, script_name)
+        options = command_parser().parse_args(argv)
+
+        if options.help:
+            print_help(options.no_logo, script_name)
             sys.exit(0)
 
-        if show_version:
+        if options.version:
             print("{}.py {}".format(script_name, script_version))
             sys.exit(0)
 
-        if self.project_path == '' or self.build_path == '':
-            print_help(no_logo, script_name)
+        self.project_path = options.project_path
+        self.build_path = options.build_path
+        self.flatc_path = options.flatc or get_flatc()
+
+        if not self.project_path or not self.build_path:
+            print_help(options.no_logo, script_name)
             sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def command_parser():
+    """Returns the command line parser of the scripts, built on the first call."""
+    import argparse
+
+    # The help is printed by print_help, to keep the copyright header.
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("-v", "--version", action="store_true")
+    parser.add_argument("--no-logo", action="store_true")
+    parser.add_argument("-p", "--project-path")
+    parser.add_argument("-b", "--build-path")
+    parser.add_argument("-f", "--flatc")
+    return parser
+
+
 def run_subprocess(argv):
     """
     Runs a subprocess with the given arguments.
@@ -146,14 +259,14 @@ def run_subprocess(argv):
         BuildError: If the subprocess returns a non-zero exit code.
     """
     try:
-        process = subprocess.Popen(argv)
+        process = subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
     except OSError as e:
-        sys.stdout.write("Cannot find executable?")
         raise BuildError(argv, 1, message=str(e))
-    process.wait()
     if process.returncode:
-        sys.stdout.write("Process has exited with 1")
-        raise BuildError(argv, process.returncode)
+        raise BuildError(argv, process.returncode, message=process.stderr.decode(errors="replace"))
+    if process.stderr:
+        # Keep the warnings of successful runs visible.
+        logger.warning("%s", process.stderr.decode(errors="replace").rstrip())
 
 
 def convert_json_to_flatbuffers_binary(flatc, json, schema, out_dir):
@@ -168,47 +281,151 @@ def convert_json_to_flatbuffers_binary(flatc, json, schema, out_dir):
     Raises:
       BuildError: Process return code was nonzero.
     """
-    command = [flatc, "-o", out_dir]
-    for path in SCHEMA_PATHS:
-        command.extend(["-I", path])
-    command.extend(["-b", schema, json])
-    run_subprocess(command)
+    convert_json_batch_to_flatbuffers_binary(flatc, [json], schema, out_dir)
+
 
+def convert_json_batch_to_flatbuffers_binary(flatc, jsons, schema, out_dir):
+    """Run the flatbuffers compiler once on several json files sharing the same schema.
+
+    Args:
+      flatc: Path to the flatc binary.
+      jsons: The paths to the json files to convert to flatbuffers binaries.
+      schema: The path to the schema to use in the conversion process.
+      out_dir: The directory to write the flatbuffers binaries.
 
-def needs_rebuild(source, target):
+    Raises:
+      BuildError: Process return code was nonzero.
+    """
+    run_subprocess(flatbuffers_binary_command(flatc, schema, out_dir) + jsons)
+
+
+def flatbuffers_binary_command(flatc, schema, out_dir):
+    """Builds the flatc command line used to convert json files, without the input files."""
+    return [flatc, "-o", out_dir, *get_schema_include_args(), "-b", schema]
+
+
+def split_command_inputs(command, inputs):
+    """Splits the inputs in batches small enough to be appended to the given command.
+
+    Args:
+      command: The command line the inputs will be appended to.
+      inputs: The list of input files.
+
+    Returns:
+      A list of input file batches.
+    """
+    reserved = sum(len(arg) + 1 for arg in command)
+    batches = []
+    batch = []
+    length = reserved
+    for file in inputs:
+        if batch and length + len(file) + 1 > MAX_COMMAND_LENGTH:
+            batches.append(batch)
+            batch = []
+            length = reserved
+        batch.append(file)
+        length += len(file) + 1
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def needs_rebuild(source_mtime_ns, target):
     """Checks if the source file needs to be rebuilt.
 
     Args:
-      source: The source file to be compared.
+      source_mtime_ns: The modification time of the most recent source, in nanoseconds.
       target: The target file which we may need to rebuild.
 
     Returns:
       True if the source file is newer than the target, or if the target file
       does not exist.
     """
-    return not os.path.isfile(target) or (
-            os.path.getmtime(source) > os.path.getmtime(target)
-    )
+    try:
+        return os.stat(target).st_mtime_ns < source_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def file_digest(path):
+    """Computes a digest of the content of the given file.
+
+    Args:
+      path: The path to the file.
+
+    Returns:
+      The hex digest of the file, or None if the file cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def load_build_cache(output_path: str):
+    """
+    Loads the build cache saved in the output directory by the last build.
+
+    The build cache maps each generated binary, relative to the output directory, to the state of its sources when it
+    was built: the modification time and size of the json file, and the digest of the schema. Binaries waiting for a
+    rebuild, or whose last build failed, are kept with a None state, so they are always rebuilt but still known to
+    clean.
+
+    Args:
+        output_path (str): Path to the output directory.
+
+    Returns:
+        The build cache, or an empty dict if there is no valid build cache.
+    """
+    try:
+        with open(os.path.join(output_path, BUILD_CACHE_FILENAME), "r") as f:
+            build_cache = json_module.load(f)
+    except (OSError, ValueError):
+        return {}
+    return build_cache if isinstance(build_cache, dict) else {}
+
+
+def save_build_cache(output_path: str, build_cache: dict):
+    """
+    Saves the build cache in the output directory.
 
+    The cache is written to a temporary file first and then renamed, so an interrupted build never leaves a truncated
+    cache behind.
 
+    Args:
+        output_path (str): Path to the output directory.
+        build_cache (dict): The build cache to save.
+    """
+    os.makedirs(output_path, exist_ok=True)
+    # Each build writes its own temporary file, so concurrent builds into the same directory don't mix their writes.
+    temp_file = tempfile.NamedTemporaryFile("w", dir=output_path, prefix=BUILD_CACHE_FILENAME, suffix=".tmp",
+                                            delete=False)
+    try:
+        with temp_file:
+            json_module.dump(build_cache, temp_file)
+        os.replace(temp_file.name, os.path.join(output_path, BUILD_CACHE_FILENAME))
+    except BaseException:
+        remove_file(temp_file.name)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
 def processed_json_path(path: str, input_path: str, output_path: str):
-    """Take the path to a raw json asset and convert it to target bin path."""
-    return path.replace(
-        ".json",
-        ".amconfig" if path.endswith("config.json")
-        else ".ambus" if path.endswith("buses.json")
-        else ".ambank" if SOUNDBANKS_DIR_NAME in path
-        else ".amcollection" if COLLECTIONS_DIR_NAME in path
-        else ".amevent" if EVENTS_DIR_NAME in path
-        else ".ampipeline" if PIPELINES_DIR_NAME in path
-        else ".amattenuation" if ATTENUATORS_DIR_NAME in path
-        else ".amswitch" if SWITCHES_DIR_NAME in path
-        else ".amswitchcontainer" if SWITCH_CONTAINERS_DIR_NAME in path
-        else ".amrtpc" if RTPC_DIR_NAME in path
-        else ".amsound" if SOUNDS_DIR_NAME in path
-        else ".amenv" if ENVIRONMENTS_DIR_NAME in path
-        else ".ambin",
-    ).replace(input_path, output_path)
+    """Take the path to a raw json asset and convert it to target bin path.
+
+    Like get_conversion_data, the file name suffixes only apply to the files at the root of the project, and the
+    files in subdirectories take the extension of their top-level asset directory.
+    """
+    relative_path = os.path.relpath(path, input_path)
+    directories = relative_path.split(os.sep)[:-1]
+    if directories:
+        extension = DIRECTORY_EXTENSIONS.get(directories[0], ".ambin")
+    else:
+        name = os.path.normcase(relative_path)
+        extension = next((ext for suffix, ext in FILE_SUFFIX_EXTENSIONS.items()
+                          if name.endswith(os.path.normcase(suffix))), ".ambin")
+    return os.path.join(output_path, relative_path[:-len(".json")] + extension)
 
 
 def processed_json_filename(path: str, input_path: str, output_path: str):
@@ -231,16 +448,69 @@ def generate_flatbuffers_binaries(flatc: str, conversion_data: list[FlatbuffersC
     Raises:
         BuildError: If the process returns a non-zero exit code.
     """
+    # Resolve flatc once, so the PATH is not searched again for each process.
+    flatc = shutil.which(flatc) or flatc
+    build_cache = load_build_cache(output_path)
+    previous_build_cache = dict(build_cache)
+
+    # Files sharing the same schema and output directory are converted by a single flatc process.
+    batches = {}
+    states = {}
     for element in conversion_data:
         schema = element.schema
+        schema_digest = file_digest(schema)
+        try:
+            schema_mtime = os.stat(schema).st_mtime_ns
+        except OSError:
+            # Let flatc report the missing schema.
+            schema_mtime = 0
         for json in element.input_files:
             target = processed_json_path(json, input_path, output_path)
-            target_file_dir = os.path.dirname(target)
-            if not os.path.exists(target_file_dir):
-                os.makedirs(target_file_dir)
-            if needs_rebuild(json, target) or needs_rebuild(schema, target):
-                convert_json_to_flatbuffers_binary(
-                    flatc, json, schema, target_file_dir)
+            key = os.path.relpath(target, output_path)
+            source_stat = os.stat(json)
+            state = [source_stat.st_mtime_ns, source_stat.st_size, schema_digest]
+            if key in build_cache:
+                # The cache knows the state of the sources, a touched but unchanged schema doesn't trigger a rebuild.
+                stale = build_cache[key] != state or not os.path.isfile(target)
+            else:
+                stale = needs_rebuild(max(schema_mtime, source_stat.st_mtime_ns), target)
+            if stale:
+                # Keep the target known to clean until it is rebuilt, an older binary may still be on disk.
+                build_cache[key] = None
+                states[json] = (key, state)
+                batches.setdefault((schema, os.path.dirname(target)), []).append(json)
+            else:
+                build_cache[key] = state
+
+    # Create each output directory once, up front, so the workers don't race on them.
+    for target_file_dir in {target_file_dir for _, target_file_dir in batches}:
+        os.makedirs(target_file_dir, exist_ok=True)
+
+    jobs = []
+    for (schema, target_file_dir), jsons in batches.items():
+        command = flatbuffers_binary_command(flatc, schema, target_file_dir)
+        for batch in split_command_inputs(command, jsons):
+            jobs.append((flatc, batch, schema, target_file_dir))
+
+    # Each job runs in its own flatc process, so threads are enough to keep all the cores busy.
+    errors = []
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [(executor.submit(convert_json_batch_to_flatbuffers_binary, *job), job[1]) for job in jobs]
+            for future, batch in futures:
+                try:
+                    future.result()
+                except BuildError as error:
+                    errors.append(error)
+                else:
+                    build_cache.update(states[json] for json in batch)
+    finally:
+        # A build with nothing to do leaves the cache untouched.
+        if build_cache != previous_build_cache:
+            save_build_cache(output_path, build_cache)
+
+    if errors:
+        raise merge_build_errors(errors)
 
 
 def find_in_paths(name, paths):
@@ -253,6 +523,12 @@ def find_in_paths(name, paths):
     return name
 
 
+@functools.lru_cache(maxsize=None)
+def schema_path(name):
+    """Returns the path to the schema with the given name, looked up in the schema paths on the first call only."""
+    return find_in_paths(name, get_schema_paths())
+
+
 def clean_flatbuffers_binaries(conversion_data: list[FlatbuffersConversionData], input_path: str, output_path: str):
     """
     Deletes all the processed flatbuffers binary files.
@@ -263,19 +539,78 @@ def clean_flatbuffers_binaries(conversion_data: list[FlatbuffersConversionData],
         input_path (str): Path to the Amplitude project directory.
         output_path (str): Path to the output directory.
     """
-    for element in conversion_data:
-        for json in element.input_files:
-            path = processed_json_path(json, input_path, output_path)
-            if os.path.isfile(path):
-                os.remove(path)
+    targets = [processed_json_path(json, input_path, output_path)
+               for element in conversion_data for json in element.input_files]
+    targets.append(os.path.join(output_path, BUILD_CACHE_FILENAME))
+    remove_files(targets)
+
+
+def clean_cached_flatbuffers_binaries(output_path: str):
+    """
+    Deletes the flatbuffers binary files recorded in the build cache of the output directory.
+
+    This does not need to look for the json files of the project, and also deletes the binaries of json files which
+    have been removed from the project since the last build.
+
+    Args:
+        output_path (str): Path to the output directory.
+
+    Returns:
+        True if the build cache was found and the binaries deleted, False otherwise.
+    """
+    build_cache = load_build_cache(output_path)
+    if not build_cache:
+        return False
+
+    targets = [os.path.join(output_path, key) for key in build_cache
+               if not os.path.isabs(key) and os.path.normpath(key).split(os.sep)[0] != os.pardir]
+    targets.append(os.path.join(output_path, BUILD_CACHE_FILENAME))
+    remove_files(targets)
+    return True
+
+
+def remove_files(paths):
+    """Deletes the given files in parallel, ignoring the ones which do not exist."""
+    # Deleting files is I/O bound, use more threads than cores to overlap the syscalls.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for _ in executor.map(remove_file, paths):
+            pass
+
+
+def remove_file(path):
+    """Deletes the given file, ignoring it if it does not exist."""
+    with suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def merge_build_errors(errors):
+    """
+    Merges several BuildErrors into a single one.
+
+    The merged error reports the first failed command, the other failed commands are appended to its message.
+
+    Args:
+        errors (list[BuildError]): The errors to merge.
+
+    Returns:
+        The merged BuildError.
+    """
+    if len(errors) == 1:
+        return errors[0]
+    first = errors[0]
+    messages = [first.message.rstrip("\n")]
+    messages.extend(format_build_error(error).rstrip("\n") for error in errors[1:])
+    return BuildError(first.argv, first.error_code, message="\n".join(messages))
+
+
+def format_build_error(error):
+    """Returns the error message for BuildErrors."""
+    return BUILD_ERROR_FORMAT % (" ".join(error.argv), error.error_code, error.message)
 
 
 def handle_build_error(error):
-    """Prints an error message to stderr for BuildErrors."""
-    sys.stderr.write(
-        "Error running command `%s`. Returned %s.\n%s\n"
-        % (" ".join(error.argv), str(error.error_code), str(error.message))
-    )
+    """Logs an error message to stderr for BuildErrors."""
+    logger.error(BUILD_ERROR_FORMAT, " ".join(error.argv), error.error_code, error.message)
 
 
 def get_amplitude_project_path():
@@ -288,15 +623,83 @@ def get_amplitude_project_path():
     Returns:
         The path to the Amplitude project directory, or None if it could not be found.
     """
-    _AM_PROJECT_PATH = None
-    try:
-        _AM_PROJECT_PATH = Path(os.getenv('AM_PROJECT_PATH'))
-    finally:
-        # if None, fallback to engine folder
-        if not _AM_PROJECT_PATH:
-            sys.stderr.write("Unable to detect the Amplitude project root path.")
+    project_path = os.getenv('AM_PROJECT_PATH')
+    if not project_path:
+        logger.error("Unable to detect the Amplitude project root path.")
+        return None
+
+    return Path(project_path)
+
+
+def find_json_files(root: str):
+    """
+    Lists the json files found in the given directory and its subdirectories.
+
+    Each directory is only listed once with os.scandir. Like glob, hidden entries are skipped and symbolic links to
+    directories are followed, a directory reached again through a link is not listed twice so link loops are safe.
 
-    return _AM_PROJECT_PATH
+    Args:
+        root (str): The directory to search in.
+
+    Returns:
+        A list of paths to the json files. The list is empty if the directory does not exist or cannot be listed.
+    """
+    files = []
+    directories = [root]
+    visited = set()
+    while directories:
+        directory = directories.pop()
+        try:
+            directory_stat = os.stat(directory)
+            if (directory_stat.st_dev, directory_stat.st_ino) in visited:
+                continue
+            visited.add((directory_stat.st_dev, directory_stat.st_ino))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        directories.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        files.append(entry.path)
+        except OSError:
+            # Like glob, skip the directories which cannot be listed.
+            pass
+    return files
+
+
+def scan_project(project_path: str):
+    """
+    Lists the json files of the Amplitude project in a single walk.
+
+    The root of the project is listed once, and only the asset directories referenced in CONVERSION_SCHEMAS are
+    walked. Like the glob patterns this replaces, asset directories are opened by name so the filesystem decides how
+    their case is matched, and root file suffixes are compared after os.path.normcase.
+
+    Args:
+        project_path (str): The path to the Amplitude project directory.
+
+    Returns:
+        A dict mapping each root file suffix and asset directory name of CONVERSION_SCHEMAS to the list of matching
+        json files.
+    """
+    files = {key: [] for _, key in CONVERSION_SCHEMAS}
+    suffixes = [key for key in files if key.endswith(".json")]
+    try:
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or entry.is_dir():
+                    continue
+                name = os.path.normcase(entry.name)
+                for suffix in suffixes:
+                    if name.endswith(os.path.normcase(suffix)):
+                        files[suffix].append(entry.path)
+    except OSError:
+        pass
+    for key in files:
+        if key not in suffixes:
+            files[key] = find_json_files(os.path.join(project_path, key))
+    return files
 
 
 def get_conversion_data(project_path: str):
@@ -304,62 +707,30 @@ def get_conversion_data(project_path: str):
     Returns a list of FlatbuffersConversionData objects that contain the necessary information to convert the
     json files to flatbuffers binaries.
 
+    Each json file is assigned to the first schema matching it only, even if it can be reached through several asset
+    directories, so it is never converted twice.
+
     Args:
         project_path (str): The path to the Amplitude project directory.
 
     Returns:
         A list of FlatbuffersConversionData objects.
     """
-    return [
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'engine_config_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, '*.config.json'))),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'buses_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, '*.buses.json'))),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'sound_bank_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, SOUNDBANKS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'collection_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, COLLECTIONS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'sound_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, SOUNDS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'event_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, EVENTS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'pipeline_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, PIPELINES_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'attenuation_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, ATTENUATORS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'switch_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, SWITCHES_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'switch_container_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, SWITCH_CONTAINERS_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'rtpc_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, RTPC_DIR_NAME, '**/*.json'), recursive=True)),
-        FlatbuffersConversionData(
-            schema=find_in_paths(
-                'effect_definition.bfbs', SCHEMA_PATHS),
-            input_files=glob.glob(os.path.join(project_path, EFFECTS_DIR_NAME, '**/*.json'), recursive=True)),
-    ]
+    files = scan_project(project_path)
+    conversion_data = []
+    claimed_files = {}
+    for schema, key in CONVERSION_SCHEMAS:
+        input_files = []
+        for file in files[key]:
+            real_path = os.path.realpath(file)
+            if real_path in claimed_files:
+                logger.warning("Skipping %s for %s, it is already converted with %s.",
+                               file, schema, claimed_files[real_path])
+                continue
+            claimed_files[real_path] = schema
+            input_files.append(file)
+        conversion_data.append(FlatbuffersConversionData(schema=schema_path(schema), input_files=input_files))
+    return conversion_data
 
 
 def print_help(no_logo: bool = False, script_name: str = None):